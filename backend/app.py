@@ -1,9 +1,21 @@
 """Flask REST API for advanced-task-management-suite."""
 
-from flask import Flask, jsonify, request
+import atexit
+import threading
+import time
+import uuid
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple, Type
+
+import msgspec
+import orjson
+from flask import Flask, Response, abort, jsonify, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from werkzeug.exceptions import HTTPException
 from my_todo_lib.manager import TaskManager
 from my_todo_lib.core.task import Task
+from my_todo_lib.core.task_list import TaskList
 from my_todo_lib.core.constants import (
     TaskStatus,
     Priority,
@@ -14,67 +26,313 @@ from backend.config import (
     PORT,
     CORS_ORIGINS,
     API_PREFIX,
+    SAVE_FLUSH_INTERVAL,
+    SAVE_RETRY_MAX_INTERVAL,
+    HEALTH_URL,
+    TASKS_URL,
+    TASKS_STREAM_URL,
+    TASK_URL,
+    TASK_MOVE_URL,
+    LISTS_URL,
+    LIST_URL,
 )
+from backend.schemas import (
+    CreateListRequest,
+    CreateTaskRequest,
+    MoveTaskRequest,
+    UpdateListRequest,
+    UpdateTaskRequest,
+    set_fields,
+)
+
+
+# =====================================================================
+# JSON Serialization
+# =====================================================================
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider that serializes and parses with orjson.
+
+    Replaces Flask's default stdlib-based provider so every ``jsonify``
+    call encodes through orjson instead of ``json.dumps``. Output is
+    always compact, so responses are not pretty-printed even when the
+    app runs with ``DEBUG`` enabled.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize ``obj`` to a JSON string."""
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes into Python objects."""
+        return orjson.loads(s)
+
+
+class JSONResponse(Response):
+    """Response class that defaults to ``application/json``.
+
+    Installed as ``app.response_class`` since every API response is JSON.
+    """
+
+    default_mimetype = 'application/json'
+
+
+def _json_response(payload, status: int = 200) -> JSONResponse:
+    """Build a JSON response directly from orjson bytes.
+
+    Used by the hottest GET endpoints to skip the ``jsonify`` provider
+    round trip (encode to bytes, decode to str, re-encode).
+    """
+    return JSONResponse(orjson.dumps(payload), status=status)
+
+
+def _read_body() -> bytes:
+    """Read the raw request body without caching it on the request.
+
+    Checks ``Content-Length`` first so empty requests are rejected before
+    the body stream or a JSON parser is touched. Chunked bodies carry no
+    ``Content-Length`` and are read normally. Aborts with 400 if the body
+    is empty.
+    """
+    if not request.content_length and 'Transfer-Encoding' not in request.headers:
+        abort(400, 'Request body is empty')
+    raw = request.get_data(cache=False)
+    if not raw:
+        abort(400, 'Request body is empty')
+    return raw
+
+
+def _decode_body(schema: Type[msgspec.Struct]):
+    """Parse and validate the request body against a msgspec schema.
+
+    Aborts with 400 if the body is empty, not valid JSON, or does not
+    match the schema.
+
+    Returns:
+        An instance of ``schema`` built from the body.
+    """
+    try:
+        return msgspec.json.decode(_read_body(), type=schema)
+    except msgspec.ValidationError as e:
+        abort(400, str(e))
+    except msgspec.DecodeError:
+        abort(400, 'Request body is not valid JSON')
+
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+app.response_class = JSONResponse
+# Match routes with or without a trailing slash instead of redirecting
+app.url_map.strict_slashes = False
 CORS(app, origins=CORS_ORIGINS)
 
-# Initialize TaskManager
-manager = TaskManager()
+# Initialize TaskManager; saves are batched by the flusher thread below
+manager = TaskManager(auto_save=False)
+
+# Maps task_id -> list_id so task endpoints don't scan every list
+_task_index: Dict[int, int] = {}
+
+
+def _task_summary(task) -> dict:
+    """Build the summary dict returned for a task by the task endpoints."""
+    return {'id': task.id, 'title': task.title, 'status': task.status,
+            'priority': task.priority}
+
+
+@lru_cache(maxsize=256)
+def _cached_get_list(list_id: int) -> Optional[TaskList]:
+    """Look up a list by ID, caching the result.
+
+    Must be called with ``_state_lock`` held, so a lookup can't race
+    ``_lists_changed()`` and repopulate the cache with a stale result.
+    Call ``_lists_changed()`` after any list is created, updated or
+    deleted.
+    """
+    return manager.get_list(list_id)
+
+
+# ETag state for GET /lists; the boot ID keeps ETags from a previous
+# process from matching after a restart resets the version counter.
+_BOOT_ID = uuid.uuid4().hex[:8]
+_lists_version = 0
+
+
+def _lists_changed() -> None:
+    """Invalidate cached list lookups and bump the lists ETag version."""
+    global _lists_version
+    _cached_get_list.cache_clear()
+    _lists_version += 1
+
+
+# =====================================================================
+# Background Persistence
+# =====================================================================
+
+# Handlers hold _state_lock only while touching in-memory state; disk
+# writes happen on a snapshot under _io_lock, so slow saves never block
+# requests.
+_state_lock = threading.RLock()
+_io_lock = threading.Lock()
+_dirty = threading.Event()
+
+# Message of the last failed background save, or None once a save succeeds
+_save_error: Optional[str] = None
+
+
+def _schedule_save() -> None:
+    """Mark in-memory state as changed so the flusher persists it."""
+    _dirty.set()
+
+
+def _save_snapshot() -> None:
+    """Serialize the container under the state lock and write it to storage.
+
+    Must be called with ``_io_lock`` held. Only ``to_dict()`` runs under
+    ``_state_lock``; encoding and the file write happen outside it.
+
+    Raises:
+        IOError: If the storage write fails
+    """
+    with _state_lock:
+        snapshot = manager.container.to_dict()
+    manager.storage.save_dict(snapshot)
+
+
+def _flusher() -> None:
+    """Save pending changes, batching writes within SAVE_FLUSH_INTERVAL.
+
+    A failed save is retried with exponential backoff up to
+    SAVE_RETRY_MAX_INTERVAL and reported through ``_save_error`` (and so
+    the health check) until a save succeeds.
+    """
+    global _save_error
+    delay = SAVE_FLUSH_INTERVAL
+    while True:
+        _dirty.wait()
+        time.sleep(delay)
+        # Clear the flag under _io_lock so _save_pending() either sees it
+        # set or waits for this save to finish.
+        with _io_lock:
+            _dirty.clear()
+            try:
+                _save_snapshot()
+            except Exception as e:
+                _dirty.set()
+                _save_error = str(e)
+                delay = min(delay * 2, SAVE_RETRY_MAX_INTERVAL)
+                app.logger.error(
+                    'Background save failed, retrying in %.1fs: %s', delay, e
+                )
+                continue
+        _save_error = None
+        delay = SAVE_FLUSH_INTERVAL
+
+
+def _save_pending() -> None:
+    """Save at shutdown if there are changes the flusher hasn't written.
+
+    Waits for any save the flusher has in progress, since the daemon
+    thread is killed at exit.
+    """
+    with _io_lock:
+        if _dirty.is_set():
+            _dirty.clear()
+            _save_snapshot()
+
+
+threading.Thread(target=_flusher, name='manager-flusher', daemon=True).start()
+atexit.register(_save_pending)
 
 
 # =====================================================================
 # Health Check Endpoint
 # =====================================================================
 
-@app.route(f'{API_PREFIX}/health', methods=['GET'])
-def health_check() -> dict:
+# Encoded once at import. A fresh response wraps it on every call because
+# after_request hooks (flask-cors) set per-request headers on the object.
+_HEALTH_BODY = orjson.dumps({
+    'status': 'healthy',
+    'message': 'API is running',
+    'version': '0.1.0'
+})
+
+
+@app.route(HEALTH_URL, methods=['GET'])
+def health_check() -> JSONResponse:
     """Check API health and status.
 
+    Reports 503 while background saves to storage are failing.
+
     Returns:
-        dict: Health status information with timestamp.
+        JSONResponse: JSON health status information.
     """
-    return jsonify({
-        'status': 'healthy',
-        'message': 'API is running',
-        'version': '0.1.0'
-    }), 200
+    if _save_error is not None:
+        return _json_response({
+            'status': 'degraded',
+            'message': f'Saving to storage is failing: {_save_error}',
+            'version': '0.1.0'
+        }, status=503)
+    return JSONResponse(_HEALTH_BODY, status=200)
 
 
 # =====================================================================
 # Task Endpoints
 # =====================================================================
 
-@app.route(f'{API_PREFIX}/tasks', methods=['GET'])
-def get_all_tasks() -> tuple:
+def _find_task(task_id: int) -> Tuple[int, Task]:
+    """Resolve a task and its list ID through the task index.
+
+    Aborts with 404 if the task does not exist.
+    """
+    list_id = _task_index.get(task_id)
+    task = manager.get_task(list_id, task_id) if list_id is not None else None
+    if task is None:
+        abort(404, f'Task {task_id} not found')
+    return list_id, task
+
+
+@app.route(TASKS_URL, methods=['GET'])
+def get_all_tasks() -> JSONResponse:
     """Get all tasks across all lists.
 
     Returns:
-        tuple: JSON response with list of tasks and HTTP status code.
+        JSONResponse: JSON response with list of tasks.
     """
-    try:
-        all_tasks = []
-        for task_list in manager.get_lists():
-            tasks = manager.get_tasks(task_list.id)
-            all_tasks.extend(tasks)
-        
-        tasks_data = [{'id': t.id, 'title': t.title, 'status': t.status, 
-                       'priority': t.priority} for t in all_tasks]
-        return jsonify({
-            'success': True,
-            'data': tasks_data,
-            'count': len(tasks_data)
-        }), 200
-
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
-
-
-@app.route(f'{API_PREFIX}/tasks/<int:task_id>', methods=['GET'])
+    with _state_lock:
+        tasks_data = [_task_summary(t) for t in manager.iter_all_tasks()]
+    return _json_response({
+        'success': True,
+        'data': tasks_data,
+        'count': len(tasks_data)
+    })
+
+
+def _ndjson_lines(tasks: List[Task]) -> Iterator[bytes]:
+    """Yield one encoded task summary line per task."""
+    for task in tasks:
+        yield orjson.dumps(_task_summary(task)) + b'\n'
+
+
+@app.route(TASKS_STREAM_URL, methods=['GET'])
+def stream_all_tasks() -> JSONResponse:
+    """Stream all tasks across all lists as NDJSON, one task per line.
+
+    Only task references are collected under the state lock; each line
+    is encoded as the client reads it, so the full payload is never
+    built in memory.
+
+    Returns:
+        JSONResponse: Streaming ``application/x-ndjson`` response.
+    """
+    with _state_lock:
+        tasks = list(manager.iter_all_tasks())
+    return JSONResponse(_ndjson_lines(tasks), status=200,
+                        mimetype='application/x-ndjson',
+                        direct_passthrough=True)
+
+
+@app.route(TASK_URL, methods=['GET'])
 def get_task(task_id: int) -> tuple:
     """Get a specific task by ID.
 
@@ -84,36 +342,17 @@ def get_task(task_id: int) -> tuple:
     Returns:
         tuple: JSON response with task data and HTTP status code.
     """
-    try:
-        # Search across all lists
-        for task_list in manager.get_lists():
-            task = manager.get_task(task_list.id, task_id)
-            if task:
-                return jsonify({
-                    'success': True,
-                    'data': {'id': task.id, 'title': task.title, 
-                            'status': task.status, 'priority': task.priority}
-                }), 200
-        
-        return jsonify({
-            'success': False,
-            'error': f'Task {task_id} not found'
-        }), 404
-
-    except KeyError as e:
-        return jsonify({
-            'success': False,
-            'error': f'Task not found: {str(e)}'
-        }), 404
-
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
-
-
-@app.route(f'{API_PREFIX}/tasks', methods=['POST'])
+    with _state_lock:
+        _, task = _find_task(task_id)
+        task_data = _task_summary(task)
+
+    return jsonify({
+        'success': True,
+        'data': task_data
+    }), 200
+
+
+@app.route(TASKS_URL, methods=['POST'])
 def create_task() -> tuple:
     """Create a new task.
 
@@ -128,61 +367,28 @@ def create_task() -> tuple:
     Returns:
         tuple: JSON response with created task and HTTP status 201.
     """
-    try:
-        data = request.get_json()
-
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'Request body is empty'
-            }), 400
-
-        if 'list_id' not in data:
-            return jsonify({
-                'success': False,
-                'error': 'Missing required field: list_id'
-            }), 400
-
-        if 'title' not in data:
-            return jsonify({
-                'success': False,
-                'error': 'Missing required field: title'
-            }), 400
-
-        task = Task(
-            title=data['title'],
-            description=data.get('description', '')
-        )
-        manager.add_task_to_list(data['list_id'], task)
-        manager.save()
-
-        return jsonify({
-            'success': True,
-            'message': 'Task created successfully',
-            'data': {'id': task.id, 'title': task.title, 
-                    'status': task.status, 'priority': task.priority}
-        }), 201
+    body = _decode_body(CreateTaskRequest)
 
+    try:
+        with _state_lock:
+            task = manager.add_task_to_list(
+                body.list_id,
+                title=body.title,
+                description=body.description or ''
+            )
+            _task_index[task.id] = body.list_id
     except ValueError as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 400
+        abort(400, str(e))
+    _schedule_save()
 
-    except KeyError as e:
-        return jsonify({
-            'success': False,
-            'error': f'Invalid list: {str(e)}'
-        }), 404
-
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    return jsonify({
+        'success': True,
+        'message': 'Task created successfully',
+        'data': _task_summary(task)
+    }), 201
 
 
-@app.route(f'{API_PREFIX}/tasks/<int:task_id>', methods=['PUT'])
+@app.route(TASK_URL, methods=['PUT'])
 def update_task(task_id: int) -> tuple:
     """Update an existing task.
 
@@ -194,58 +400,33 @@ def update_task(task_id: int) -> tuple:
             "title": "New title",
             "description": "New description",
             "status": "in_progress",
-            "priority": "high"
+            "priority": "high",
+            "due_date": "2025-01-01T09:00:00"
         }
 
     Returns:
         tuple: JSON response with updated task and HTTP status 200.
     """
-    try:
-        data = request.get_json()
-
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'Request body is empty'
-            }), 400
-
-        # Find task in all lists and update it
-        for task_list in manager.get_lists():
-            task = manager.get_task(task_list.id, task_id)
-            if task:
-                manager.update_task(task_list.id, task_id, **data)
-                return jsonify({
-                    'success': True,
-                    'message': 'Task updated successfully',
-                    'data': {'id': task.id, 'title': task.title, 
-                            'status': task.status, 'priority': task.priority}
-                }), 200
-        
-        return jsonify({
-            'success': False,
-            'error': f'Task {task_id} not found'
-        }), 404
-
-    except KeyError as e:
-        return jsonify({
-            'success': False,
-            'error': f'Task not found: {str(e)}'
-        }), 404
+    data = set_fields(_decode_body(UpdateTaskRequest))
+    if not data:
+        abort(400, 'No fields to update')
+
+    with _state_lock:
+        list_id, task = _find_task(task_id)
+        try:
+            manager.update_task(list_id, task_id, **data)
+        except ValueError as e:
+            abort(400, str(e))
+    _schedule_save()
 
-    except ValueError as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 400
-
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    return jsonify({
+        'success': True,
+        'message': 'Task updated successfully',
+        'data': _task_summary(task)
+    }), 200
 
 
-@app.route(f'{API_PREFIX}/tasks/<int:task_id>', methods=['DELETE'])
+@app.route(TASK_URL, methods=['DELETE'])
 def delete_task(task_id: int) -> tuple:
     """Delete a task.
 
@@ -255,36 +436,19 @@ def delete_task(task_id: int) -> tuple:
     Returns:
         tuple: JSON response with success message and HTTP status 200.
     """
-    try:
-        # Find and delete task from all lists
-        for task_list in manager.get_lists():
-            task = manager.get_task(task_list.id, task_id)
-            if task:
-                manager.delete_task(task_list.id, task_id)
-                return jsonify({
-                    'success': True,
-                    'message': f'Task {task_id} deleted successfully'
-                }), 200
-        
-        return jsonify({
-            'success': False,
-            'error': f'Task {task_id} not found'
-        }), 404
-
-    except KeyError as e:
-        return jsonify({
-            'success': False,
-            'error': f'Task not found: {str(e)}'
-        }), 404
-
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
-
-
-@app.route(f'{API_PREFIX}/tasks/<int:task_id>/move', methods=['POST'])
+    with _state_lock:
+        list_id, _ = _find_task(task_id)
+        manager.delete_task(list_id, task_id)
+        _task_index.pop(task_id, None)
+    _schedule_save()
+
+    return jsonify({
+        'success': True,
+        'message': f'Task {task_id} deleted successfully'
+    }), 200
+
+
+@app.route(TASK_MOVE_URL, methods=['POST'])
 def move_task(task_id: int) -> tuple:
     """Move a task to another list.
 
@@ -300,82 +464,63 @@ def move_task(task_id: int) -> tuple:
     Returns:
         tuple: JSON response with moved task and HTTP status 200.
     """
-    try:
-        data = request.get_json()
-
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'Request body is empty'
-            }), 400
-
-        if 'source_list_id' not in data or 'target_list_id' not in data:
-            return jsonify({
-                'success': False,
-                'error': 'Missing required fields: source_list_id, target_list_id'
-            }), 400
-
-        task = manager.move_task_to_list(
-            source_list_id=data['source_list_id'],
-            task_id=task_id,
-            target_list_id=data['target_list_id']
-        )
-
-        return jsonify({
-            'success': True,
-            'message': 'Task moved successfully',
-            'data': task.to_dict()
-        }), 200
+    body = _decode_body(MoveTaskRequest)
 
+    try:
+        with _state_lock:
+            task = manager.move_task_to_list(
+                source_list_id=body.source_list_id,
+                task_id=task_id,
+                target_list_id=body.target_list_id
+            )
+            _task_index[task.id] = body.target_list_id
     except ValueError as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 400
+        abort(400, str(e))
+    _schedule_save()
 
-    except KeyError as e:
-        return jsonify({
-            'success': False,
-            'error': f'Resource not found: {str(e)}'
-        }), 404
-
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    return jsonify({
+        'success': True,
+        'message': 'Task moved successfully',
+        'data': task.to_dict()
+    }), 200
 
 
 # =====================================================================
 # List Endpoints
 # =====================================================================
 
-@app.route(f'{API_PREFIX}/lists', methods=['GET'])
-def get_all_lists() -> tuple:
+@app.route(LISTS_URL, methods=['GET'])
+def get_all_lists() -> JSONResponse:
     """Get all task lists.
 
+    Responses carry an ETag; a request whose ``If-None-Match`` matches
+    the current ETag gets an empty 304 Not Modified instead.
+
     Returns:
-        tuple: JSON response with list of all lists and HTTP status code.
+        JSONResponse: JSON response with list of all lists.
     """
-    try:
+    etag = f'{_BOOT_ID}-{_lists_version}'
+    if request.if_none_match.contains_weak(etag):
+        response = JSONResponse(status=304)
+        response.set_etag(etag)
+        return response
+
+    with _state_lock:
+        etag = f'{_BOOT_ID}-{_lists_version}'
         lists = manager.get_lists()
-        lists_data = [{'id': tl.id, 'name': tl.name, 'description': tl.description} 
-                     for tl in lists]
+        lists_data = [{'id': tl.id, 'name': tl.name, 'description': tl.description}
+                      for tl in lists]
 
-        return jsonify({
-            'success': True,
-            'data': lists_data,
-            'count': len(lists_data)
-        }), 200
+    response = _json_response({
+        'success': True,
+        'data': lists_data,
+        'count': len(lists_data)
+    })
+    response.set_etag(etag)
+    return response
 
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
 
-
-@app.route(f'{API_PREFIX}/lists/<int:list_id>', methods=['GET'])
+@app.route(LIST_URL, methods=['GET'])
 def get_list(list_id: int) -> tuple:
     """Get a specific list by ID.
 
@@ -385,35 +530,20 @@ def get_list(list_id: int) -> tuple:
     Returns:
         tuple: JSON response with list data and HTTP status code.
     """
-    try:
-        task_list = manager.get_list(list_id)
-
+    with _state_lock:
+        task_list = _cached_get_list(list_id)
         if not task_list:
-            return jsonify({
-                'success': False,
-                'error': f'List {list_id} not found'
-            }), 404
-
-        return jsonify({
-            'success': True,
-            'data': {'id': task_list.id, 'name': task_list.name,
-                    'description': task_list.description}
-        }), 200
-
-    except KeyError as e:
-        return jsonify({
-            'success': False,
-            'error': f'List not found: {str(e)}'
-        }), 404
-
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
-
-
-@app.route(f'{API_PREFIX}/lists', methods=['POST'])
+            abort(404, f'List {list_id} not found')
+        list_data = {'id': task_list.id, 'name': task_list.name,
+                     'description': task_list.description}
+
+    return jsonify({
+        'success': True,
+        'data': list_data
+    }), 200
+
+
+@app.route(LISTS_URL, methods=['POST'])
 def create_list() -> tuple:
     """Create a new list.
 
@@ -426,47 +556,28 @@ def create_list() -> tuple:
     Returns:
         tuple: JSON response with created list and HTTP status 201.
     """
-    try:
-        data = request.get_json()
-
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'Request body is empty'
-            }), 400
-
-        if 'name' not in data:
-            return jsonify({
-                'success': False,
-                'error': 'Missing required field: name'
-            }), 400
-
-        task_list = manager.create_list(
-            name=data['name'],
-            description=data.get('description', '')
-        )
-
-        return jsonify({
-            'success': True,
-            'message': 'List created successfully',
-            'data': {'id': task_list.id, 'name': task_list.name,
-                    'description': task_list.description}
-        }), 201
+    body = _decode_body(CreateListRequest)
 
+    try:
+        with _state_lock:
+            task_list = manager.create_list(
+                name=body.name,
+                description=body.description or ''
+            )
+            _lists_changed()
     except ValueError as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 400
+        abort(400, str(e))
+    _schedule_save()
 
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    return jsonify({
+        'success': True,
+        'message': 'List created successfully',
+        'data': {'id': task_list.id, 'name': task_list.name,
+                'description': task_list.description}
+    }), 201
 
 
-@app.route(f'{API_PREFIX}/lists/<int:list_id>', methods=['PUT'])
+@app.route(LIST_URL, methods=['PUT'])
 def update_list(list_id: int) -> tuple:
     """Update an existing list.
 
@@ -482,58 +593,38 @@ def update_list(list_id: int) -> tuple:
     Returns:
         tuple: JSON response with updated list and HTTP status 200.
     """
-    try:
-        data = request.get_json()
-
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'Request body is empty'
-            }), 400
+    data = set_fields(_decode_body(UpdateListRequest))
+    if not data:
+        abort(400, 'No fields to update')
 
-        task_list = manager.get_list(list_id)
+    with _state_lock:
+        task_list = _cached_get_list(list_id)
         if not task_list:
-            return jsonify({
-                'success': False,
-                'error': f'List {list_id} not found'
-            }), 404
-
-        # Update using rename_list for name
-        if 'name' in data:
-            manager.rename_list(list_id, data['name'])
-        
-        # Update description if provided (check if method exists)
-        if 'description' in data and hasattr(task_list, 'description'):
-            task_list.description = data['description']
-
-        task_list = manager.get_list(list_id)
-        return jsonify({
-            'success': True,
-            'message': 'List updated successfully',
-            'data': {'id': task_list.id, 'name': task_list.name,
-                    'description': task_list.description}
-        }), 200
-
-    except KeyError as e:
-        return jsonify({
-            'success': False,
-            'error': f'List not found: {str(e)}'
-        }), 404
-
-    except ValueError as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 400
+            abort(404, f'List {list_id} not found')
+
+        try:
+            # Update using rename_list for name
+            if 'name' in data:
+                manager.rename_list(list_id, data['name'])
+
+            # Update description if provided
+            if 'description' in data:
+                task_list.description = data['description']
+        except ValueError as e:
+            abort(400, str(e))
+        finally:
+            _lists_changed()
+    _schedule_save()
 
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    return jsonify({
+        'success': True,
+        'message': 'List updated successfully',
+        'data': {'id': task_list.id, 'name': task_list.name,
+                'description': task_list.description}
+    }), 200
 
 
-@app.route(f'{API_PREFIX}/lists/<int:list_id>', methods=['DELETE'])
+@app.route(LIST_URL, methods=['DELETE'])
 def delete_list(list_id: int) -> tuple:
     """Delete a list and all its tasks.
 
@@ -543,59 +634,42 @@ def delete_list(list_id: int) -> tuple:
     Returns:
         tuple: JSON response with success message and HTTP status 200.
     """
-    try:
-        manager.delete_list(list_id)
-
-        return jsonify({
-            'success': True,
-            'message': f'List {list_id} deleted successfully'
-        }), 200
+    with _state_lock:
+        task_list = _cached_get_list(list_id)
+        if task_list is None:
+            abort(404, f'List {list_id} not found')
 
-    except KeyError as e:
-        return jsonify({
-            'success': False,
-            'error': f'List not found: {str(e)}'
-        }), 404
+        manager.delete_list(list_id)
+        _lists_changed()
+        for task in task_list.get_all_tasks():
+            _task_index.pop(task.id, None)
+    _schedule_save()
 
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    return jsonify({
+        'success': True,
+        'message': f'List {list_id} deleted successfully'
+    }), 200
 
 
 # =====================================================================
 # Error Handlers
 # =====================================================================
 
-@app.errorhandler(400)
-def bad_request(error) -> tuple:
-    """Handle 400 Bad Request errors."""
-    return jsonify({
-        'success': False,
-        'error': 'Bad request',
-        'message': str(error)
-    }), 400
-
-
-@app.errorhandler(404)
-def not_found(error) -> tuple:
-    """Handle 404 Not Found errors."""
-    return jsonify({
-        'success': False,
-        'error': 'Resource not found',
-        'message': str(error)
-    }), 404
-
+@app.errorhandler(HTTPException)
+def handle_http_error(error: HTTPException) -> tuple:
+    """Format HTTP errors, including ``abort()`` calls, as JSON.
 
-@app.errorhandler(500)
-def internal_error(error) -> tuple:
-    """Handle 500 Internal Server Error."""
-    return jsonify({
+    Headers set by the exception (such as ``Allow`` on 405) are kept.
+    Unhandled exceptions reach this handler as 500 Internal Server Error.
+    """
+    response = jsonify({
         'success': False,
-        'error': 'Internal server error',
-        'message': str(error)
-    }), 500
+        'error': error.description
+    })
+    for name, value in error.get_headers():
+        if name.lower() != 'content-type':
+            response.headers.add(name, value)
+    return response, error.code
 
 
 # =====================================================================
@@ -605,5 +679,5 @@ def internal_error(error) -> tuple:
 if __name__ == '__main__':
     print(f"🚀 Starting API server on http://{HOST}:{PORT}")
     print(f"📚 API endpoints available at http://{HOST}:{PORT}{API_PREFIX}")
-    print(f"Health check: http://{HOST}:{PORT}{API_PREFIX}/health")
+    print(f"Health check: http://{HOST}:{PORT}{HEALTH_URL}")
     app.run(host=HOST, port=PORT, debug=DEBUG)
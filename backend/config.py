@@ -20,7 +20,18 @@ CORS_ORIGINS = [
 # Storage Configuration
 STORAGE_PATH = os.path.expanduser('~/.my_todo_lib')
 TASKS_FILE = os.path.join(STORAGE_PATH, 'tasks.json')
+SAVE_FLUSH_INTERVAL = 0.05  # Seconds to batch writes before saving
+SAVE_RETRY_MAX_INTERVAL = 30.0  # Max seconds between failed-save retries
 
 # API Configuration
 API_VERSION = 'v1'
 API_PREFIX = f'/api/{API_VERSION}'
+
+# API Routes
+HEALTH_URL = f'{API_PREFIX}/health'
+TASKS_URL = f'{API_PREFIX}/tasks'
+TASKS_STREAM_URL = f'{TASKS_URL}/stream'
+TASK_URL = f'{TASKS_URL}/<int:task_id>'
+TASK_MOVE_URL = f'{TASK_URL}/move'
+LISTS_URL = f'{API_PREFIX}/lists'
+LIST_URL = f'{LISTS_URL}/<int:list_id>'
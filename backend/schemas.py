@@ -0,0 +1,62 @@
+"""Request body schemas for the Flask API.
+
+Each schema is a msgspec Struct, so a request body is parsed and
+type-checked in a single decode call. Update schemas default every
+field to ``UNSET`` so a partial body only touches the fields it sends.
+"""
+
+from datetime import datetime
+from typing import Optional, Union
+
+import msgspec
+from msgspec import UNSET, UnsetType
+
+from my_todo_lib.core.constants import Priority, TaskStatus
+
+
+class CreateTaskRequest(msgspec.Struct):
+    """Body of POST /tasks."""
+
+    list_id: int
+    title: str
+    description: Optional[str] = ''
+
+
+class UpdateTaskRequest(msgspec.Struct, forbid_unknown_fields=True):
+    """Body of PUT /tasks/<task_id>."""
+
+    title: Union[str, UnsetType] = UNSET
+    description: Union[Optional[str], UnsetType] = UNSET
+    status: Union[TaskStatus, UnsetType] = UNSET
+    priority: Union[Priority, UnsetType] = UNSET
+    due_date: Union[Optional[datetime], UnsetType] = UNSET
+
+
+class MoveTaskRequest(msgspec.Struct):
+    """Body of POST /tasks/<task_id>/move."""
+
+    source_list_id: int
+    target_list_id: int
+
+
+class CreateListRequest(msgspec.Struct):
+    """Body of POST /lists."""
+
+    name: str
+    description: Optional[str] = ''
+
+
+class UpdateListRequest(msgspec.Struct, forbid_unknown_fields=True):
+    """Body of PUT /lists/<list_id>."""
+
+    name: Union[str, UnsetType] = UNSET
+    description: Union[Optional[str], UnsetType] = UNSET
+
+
+def set_fields(body: msgspec.Struct) -> dict:
+    """Return the fields of ``body`` that were present in the request."""
+    return {
+        name: value
+        for name, value in msgspec.structs.asdict(body).items()
+        if value is not UNSET
+    }
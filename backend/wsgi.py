@@ -0,0 +1,13 @@
+"""WSGI entry point for running the API under a production server.
+
+Run with gunicorn, using a single worker process with threads::
+
+    gunicorn -w 1 -k gthread --threads 8 backend.wsgi:application
+
+All state lives in one in-memory TaskManager, so multiple worker
+processes would each hold a separate copy of the data.
+"""
+
+from backend.app import app
+
+application = app
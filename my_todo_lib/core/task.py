@@ -212,7 +212,7 @@ class Task:
             "status": self._status.value,
             "priority": self._priority.value,
             "due_date": self._due_date.isoformat() if self._due_date else None,
-            "tags": self._tags,
+            "tags": self._tags.copy(),
             "created_at": self._created_at.isoformat(),
             "modified_at": self._modified_at.isoformat(),
         }
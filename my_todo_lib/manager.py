@@ -1,7 +1,7 @@
 """TaskManager - Main orchestrator for the to-do library."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from my_todo_lib.core.list_container import ListContainer
 from my_todo_lib.core.task_list import TaskList
 from my_todo_lib.core.task import Task
@@ -25,16 +25,24 @@ class TaskManager:
     Attributes:
         container: ListContainer managing all lists
         storage: Storage backend for persistence
+        auto_save: Whether mutations are saved to storage immediately
     """
 
-    def __init__(self, storage: Optional[Storage] = None):
+    def __init__(
+        self,
+        storage: Optional[Storage] = None,
+        auto_save: bool = True,
+    ):
         """Initialize TaskManager with optional storage.
 
         Args:
             storage: Storage backend to use (default: JSONStorage with tasks.json)
+            auto_save: Save after every mutation (default: True). When False,
+                callers are responsible for calling save().
         """
         self._container = ListContainer()
         self._storage = storage if storage else JSONStorage("tasks.json")
+        self._auto_save = auto_save
 
     @property
     def container(self) -> ListContainer:
@@ -46,6 +54,11 @@ class TaskManager:
         """Get the storage backend."""
         return self._storage
 
+    @property
+    def auto_save(self) -> bool:
+        """Whether mutations are saved to storage immediately."""
+        return self._auto_save
+
     # ============= List Management =============
 
     def create_list(
@@ -66,7 +79,7 @@ class TaskManager:
             ValueError: If name is invalid
         """
         task_list = self._container.create_list(name, description)
-        self.save()
+        self._maybe_save()
         return task_list
 
     def get_lists(self) -> List[TaskList]:
@@ -100,7 +113,7 @@ class TaskManager:
         result = self._container.remove_list(list_id)
         if not result:
             raise ValueError(f"List with ID {list_id} not found")
-        self.save()
+        self._maybe_save()
 
     def rename_list(self, list_id: int, new_name: str) -> None:
         """Rename a list.
@@ -113,7 +126,7 @@ class TaskManager:
             ValueError: If list not found or new_name invalid
         """
         self._container.rename_list(list_id, new_name)
-        self.save()
+        self._maybe_save()
 
     def set_list_ordering(self, strategy: OrderingStrategy) -> None:
         """Set how lists are ordered.
@@ -125,7 +138,7 @@ class TaskManager:
             ValueError: If strategy is invalid
         """
         self._container.set_ordering_strategy(strategy)
-        self.save()
+        self._maybe_save()
 
     def move_list(self, list_id: int, position: int) -> None:
         """Move a list to a new position (MANUAL strategy only).
@@ -138,7 +151,7 @@ class TaskManager:
             ValueError: If strategy is not MANUAL or parameters invalid
         """
         self._container.move_list(list_id, position)
-        self.save()
+        self._maybe_save()
 
     # ============= Task Management =============
 
@@ -182,7 +195,7 @@ class TaskManager:
             tags=tags,
         )
         task_list.add_task(task)
-        self.save()
+        self._maybe_save()
         return task
 
     def get_task(self, list_id: int, task_id: int) -> Optional[Task]:
@@ -226,6 +239,19 @@ class TaskManager:
 
         return task_list.get_tasks(status=status, sort_by=sort_by)
 
+    def iter_all_tasks(self) -> Iterator[Task]:
+        """Iterate over the tasks of every list in a single pass.
+
+        Lists are visited in the current ordering strategy and each list's
+        tasks in creation order, matching calling ``get_tasks`` for every
+        list in ``get_lists()`` without looking each list up by ID.
+
+        Yields:
+            Task objects across all lists
+        """
+        for task_list in self._container.get_lists():
+            yield from task_list.get_tasks()
+
     def update_task(
         self,
         list_id: int,
@@ -255,7 +281,7 @@ class TaskManager:
                 raise ValueError(f"Cannot update property: {key}")
             setattr(task, key, value)
 
-        self.save()
+        self._maybe_save()
 
     def delete_task(self, list_id: int, task_id: int) -> bool:
         """Delete a task from a list.
@@ -276,7 +302,7 @@ class TaskManager:
 
         result = task_list.remove_task(task_id)
         if result:
-            self.save()
+            self._maybe_save()
         return result
 
     def move_task_to_list(
@@ -324,7 +350,7 @@ class TaskManager:
         target_list.add_task(task)
 
         # Save changes
-        self.save()
+        self._maybe_save()
 
         return task
 
@@ -370,6 +396,11 @@ class TaskManager:
 
     # ============= Persistence =============
 
+    def _maybe_save(self) -> None:
+        """Save after a mutation if auto-save is enabled."""
+        if self._auto_save:
+            self.save()
+
     def save(self) -> None:
         """Save all data to storage.
 
@@ -23,6 +23,21 @@ class Storage(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_dict(self, data: dict) -> None:
+        """Save a container already serialized with ListContainer.to_dict().
+
+        Lets callers take a cheap snapshot of the container and write it
+        later, outside any lock guarding the live container.
+
+        Args:
+            data: Dictionary produced by ListContainer.to_dict()
+
+        Raises:
+            IOError: If save operation fails
+        """
+        pass
+
     @abstractmethod
     def load(self) -> ListContainer:
         """Load a ListContainer from persistent storage.
@@ -2,6 +2,7 @@
 
 import json
 import os
+import uuid
 from datetime import datetime
 from typing import Dict, Any
 from my_todo_lib.storage.base import Storage
@@ -42,12 +43,35 @@ class JSONStorage(Storage):
         """
         try:
             data = container.to_dict()
-            with open(self._file_path, "w") as f:
+        except Exception as e:
+            raise IOError(f"Unexpected error saving to JSON: {str(e)}")
+        self.save_dict(data)
+
+    def save_dict(self, data: Dict[str, Any]) -> None:
+        """Save an already-serialized container to the JSON file.
+
+        Writes to a temporary file in the same directory and renames it
+        over the target, so an interrupted save never leaves a truncated
+        file behind.
+
+        Args:
+            data: Dictionary produced by ListContainer.to_dict()
+
+        Raises:
+            IOError: If file write fails
+        """
+        tmp_path = f"{self._file_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
                 json.dump(data, f, indent=2)
+            os.replace(tmp_path, self._file_path)
         except IOError as e:
             raise IOError(f"Failed to save to {self._file_path}: {str(e)}")
         except Exception as e:
             raise IOError(f"Unexpected error saving to JSON: {str(e)}")
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def load(self) -> ListContainer:
         """Load ListContainer from JSON file.
@@ -1,5 +1,19 @@
+import os
+
 from setuptools import setup, find_packages
 
+# Optionally compile the API module to a C extension. Opt in with
+# BUILD_CYTHON=1 (requires Cython); otherwise the pure-Python
+# backend/app.py is installed as usual.
+ext_modules = []
+if os.getenv("BUILD_CYTHON") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["backend/app.py"],
+        compiler_directives={"language_level": 3},
+    )
+
 setup(
     name="my-todo-library",
     version="0.1.0",
@@ -7,6 +21,7 @@ setup(
     author="Your Name",
     author_email="your.email@example.com",
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=[],
     python_requires=">=3.7",
     classifiers=[
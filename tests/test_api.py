@@ -1,21 +1,39 @@
 """Pragmatic test suite for Flask REST API backend.
 
-Focuses on proven, working endpoints: health check and list CRUD operations.
-Task endpoints excluded temporarily due to TaskManager integration issues.
+Focuses on proven, working endpoints: health check, list CRUD operations,
+and task lookup by ID.
 
-Total Tests: 18
+Total Tests: 43
 Coverage Target: 80%+ on working endpoints
 Status: All tests targeting known-working functionality ✅
 
 Test Organization:
-- TestHealthCheck: 1 test
-- TestListCRUD: 8 tests
-- TestListErrorHandling: 5 tests
-- TestErrorResponses: 4 tests
+- TestHealthCheck: 4 tests
+- TestListCRUD: 12 tests
+- TestListErrorHandling: 7 tests
+- TestErrorResponses: 7 tests
+- TestTaskLookup: 10 tests
+- TestShutdownPersistence: 3 tests
 """
 
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import backend.app as app_module
 from backend.app import app
 
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run_in_dir(code, cwd):
+    """Run Python code in a fresh interpreter with the repo importable."""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env, check=True)
+
 
 class TestHealthCheck:
     """Test suite for health check endpoint."""
@@ -34,6 +52,45 @@ class TestHealthCheck:
         assert 'message' in data
         assert 'version' in data
 
+    def test_health_check_cors_headers_are_per_request(self):
+        """Test CORS headers from one request don't leak into the next."""
+        self.client.get(
+            '/api/v1/health', headers={'Origin': 'http://localhost:3000'}
+        )
+        response = self.client.get('/api/v1/health')
+        assert response.headers.get('Access-Control-Allow-Origin') == '*'
+        assert 'Vary' not in response.headers
+
+    def test_health_check_reports_failing_saves(self, monkeypatch):
+        """Test health check returns 503 while background saves fail."""
+        def failing_save():
+            raise IOError('disk full')
+
+        monkeypatch.setattr(app_module, '_save_snapshot', failing_save)
+        self.client.post('/api/v1/lists', json={'name': 'Unsaved'})
+        response = self._wait_for_health_status(503)
+        data = response.get_json()
+        assert data['status'] == 'degraded'
+        assert 'disk full' in data['message']
+
+        monkeypatch.undo()
+        assert self._wait_for_health_status(200).status_code == 200
+
+    def _wait_for_health_status(self, status, timeout=5.0):
+        """Poll the health check until it returns ``status``."""
+        deadline = time.monotonic() + timeout
+        while True:
+            response = self.client.get('/api/v1/health')
+            if response.status_code == status or time.monotonic() > deadline:
+                return response
+            time.sleep(0.02)
+
+    def test_trailing_slash_not_redirected(self):
+        """Test a trailing slash is served directly without a redirect."""
+        response = self.client.get('/api/v1/health/')
+        assert response.status_code == 200
+        assert response.get_json()['status'] == 'healthy'
+
 
 class TestListCRUD:
     """Test suite for list CRUD operations."""
@@ -75,6 +132,43 @@ class TestListCRUD:
         assert 'count' in data
         assert data['count'] >= 1
 
+    def test_get_all_lists_not_modified(self):
+        """Test GET /lists returns 304 when the ETag still matches."""
+        response = self.client.get('/api/v1/lists')
+        etag = response.headers['ETag']
+
+        cached = self.client.get(
+            '/api/v1/lists', headers={'If-None-Match': etag}
+        )
+        assert cached.status_code == 304
+        assert cached.data == b''
+        assert cached.headers['ETag'] == etag
+
+    def test_get_all_lists_not_modified_weak_and_listed_etags(self):
+        """Test weak ETags and ETag lists in If-None-Match also match."""
+        etag = self.client.get('/api/v1/lists').headers['ETag']
+
+        weak = self.client.get(
+            '/api/v1/lists', headers={'If-None-Match': f'W/{etag}'}
+        )
+        assert weak.status_code == 304
+
+        listed = self.client.get(
+            '/api/v1/lists', headers={'If-None-Match': f'"other", {etag}'}
+        )
+        assert listed.status_code == 304
+
+    def test_get_all_lists_etag_changes_on_create(self):
+        """Test creating a list invalidates the previous ETag."""
+        etag = self.client.get('/api/v1/lists').headers['ETag']
+        self.client.post('/api/v1/lists', json={'name': 'Fresh'})
+
+        response = self.client.get(
+            '/api/v1/lists', headers={'If-None-Match': etag}
+        )
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
     def test_get_single_list_success(self):
         """Test getting a single list by ID returns 200."""
         # Create a list
@@ -131,6 +225,29 @@ class TestListCRUD:
         get_resp = self.client.get(f'/api/v1/lists/{list_id}')
         assert get_resp.status_code == 404
 
+    def test_deleted_list_not_served_from_cache(self):
+        """Test a list fetched before deletion returns 404 afterwards."""
+        create_resp = self.client.post(
+            '/api/v1/lists',
+            json={'name': 'Cached', 'description': 'Read then deleted'}
+        )
+        list_id = create_resp.get_json()['data']['id']
+
+        assert self.client.get(f'/api/v1/lists/{list_id}').status_code == 200
+        self.client.delete(f'/api/v1/lists/{list_id}')
+
+        get_resp = self.client.get(f'/api/v1/lists/{list_id}')
+        assert get_resp.status_code == 404
+
+    def test_create_list_with_null_description(self):
+        """Test a null description is accepted and stored as empty."""
+        response = self.client.post(
+            '/api/v1/lists',
+            json={'name': 'No Description', 'description': None}
+        )
+        assert response.status_code == 201
+        assert response.get_json()['data']['description'] == ''
+
     def test_create_list_requires_name(self):
         """Test creating list without name returns 400."""
         response = self.client.post(
@@ -178,6 +295,14 @@ class TestListErrorHandling:
         data = response.get_json()
         assert data['success'] is False
 
+    def test_delete_nonexistent_list_returns_404(self):
+        """Test deleting non-existent list returns 404."""
+        response = self.client.delete('/api/v1/lists/99999')
+        assert response.status_code == 404
+        data = response.get_json()
+        assert data['success'] is False
+        assert 'error' in data
+
     def test_update_list_with_no_fields_returns_400(self):
         """Test updating list with no fields returns 400."""
         # Create a list
@@ -194,6 +319,20 @@ class TestListErrorHandling:
         )
         assert response.status_code == 400
 
+    def test_update_list_rejects_invalid_bodies(self):
+        """Test updating a list with a malformed or mistyped body returns 400."""
+        create_resp = self.client.post(
+            '/api/v1/lists',
+            json={'name': 'Typed List'}
+        )
+        list_id = create_resp.get_json()['data']['id']
+
+        for body in ('xname', [1], {'name': 5}, {'description': 5},
+                     {'color': 'red'}):
+            response = self.client.put(f'/api/v1/lists/{list_id}', json=body)
+            assert response.status_code == 400, body
+            assert response.get_json()['success'] is False
+
     def test_update_list_error_response_format(self):
         """Test that error responses have consistent format."""
         response = self.client.put(
@@ -248,6 +387,35 @@ class TestErrorResponses:
         assert data['success'] is False
         assert 'error' in data
 
+    def test_unsupported_method_returns_json(self):
+        """Test 405 responses use the JSON error format."""
+        response = self.client.delete('/api/v1/health')
+        assert response.status_code == 405
+        assert 'GET' in response.headers['Allow']
+        data = response.get_json()
+        assert data['success'] is False
+        assert 'error' in data
+
+    def test_invalid_json_body_returns_400(self):
+        """Test malformed JSON bodies return 400."""
+        response = self.client.post(
+            '/api/v1/lists',
+            data='{"name": ',
+            content_type='application/json'
+        )
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data['success'] is False
+        assert 'error' in data
+
+    def test_empty_body_returns_400(self):
+        """Test requests without a body return 400."""
+        response = self.client.post('/api/v1/lists')
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data['success'] is False
+        assert data['error'] == 'Request body is empty'
+
     def test_success_response_has_data_field(self):
         """Test success responses have expected fields."""
         response = self.client.get('/api/v1/health')
@@ -273,3 +441,190 @@ class TestErrorResponses:
         assert read_list['id'] == created_list['id']
         assert read_list['name'] == created_list['name']
         assert read_list['description'] == created_list['description']
+
+
+class TestTaskLookup:
+    """Test suite for task endpoints resolved through the task index."""
+
+    def setup_method(self):
+        """Setup for each test."""
+        self.client = app.test_client()
+        create_resp = self.client.post(
+            '/api/v1/lists',
+            json={'name': 'Indexed', 'description': 'Task index tests'}
+        )
+        self.list_id = create_resp.get_json()['data']['id']
+
+    def _create_task(self, title):
+        """Create a task in the test list and return its ID."""
+        response = self.client.post(
+            '/api/v1/tasks',
+            json={'list_id': self.list_id, 'title': title}
+        )
+        assert response.status_code == 201
+        return response.get_json()['data']['id']
+
+    def test_get_created_task(self):
+        """Test a newly created task can be fetched by ID."""
+        task_id = self._create_task('Find me')
+
+        response = self.client.get(f'/api/v1/tasks/{task_id}')
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['data']['id'] == task_id
+        assert data['data']['title'] == 'Find me'
+
+    def test_get_all_tasks_includes_summary_fields(self):
+        """Test GET /tasks returns summaries of created tasks."""
+        task_id = self._create_task('Listed')
+
+        response = self.client.get('/api/v1/tasks')
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['count'] == len(data['data'])
+        task = next(t for t in data['data'] if t['id'] == task_id)
+        assert task == {
+            'id': task_id, 'title': 'Listed',
+            'status': 'todo', 'priority': 'medium'
+        }
+
+    def test_stream_all_tasks_ndjson(self):
+        """Test GET /tasks/stream returns one JSON task per line."""
+        task_id = self._create_task('Streamed')
+
+        response = self.client.get('/api/v1/tasks/stream')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        lines = response.data.decode().splitlines()
+        tasks = [json.loads(line) for line in lines]
+        assert {'id': task_id, 'title': 'Streamed', 'status': 'todo',
+                'priority': 'medium'} in tasks
+
+    def test_create_task_with_invalid_list_id_type_returns_400(self):
+        """Test creating a task with a non-integer list_id returns 400."""
+        response = self.client.post(
+            '/api/v1/tasks',
+            json={'list_id': 'one', 'title': 'Typed'}
+        )
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data['success'] is False
+        assert 'list_id' in data['error']
+
+    def test_update_task_fields(self):
+        """Test updating a task decodes status and priority values."""
+        task_id = self._create_task('Update me')
+
+        response = self.client.put(
+            f'/api/v1/tasks/{task_id}',
+            json={'status': 'in_progress', 'priority': 'high',
+                  'due_date': '2025-01-01T09:00:00'}
+        )
+        assert response.status_code == 200
+        data = response.get_json()['data']
+        assert data['status'] == 'in_progress'
+        assert data['priority'] == 'high'
+
+    def test_update_task_rejects_invalid_bodies(self):
+        """Test updating a task with a malformed or mistyped body returns 400."""
+        task_id = self._create_task('Typed')
+
+        for body in ([1], {'title': 5}, {'status': 'done'},
+                     {'due_date': '2025-01-01'}, {'tags': ['x']}, {}):
+            response = self.client.put(f'/api/v1/tasks/{task_id}', json=body)
+            assert response.status_code == 400, body
+            assert response.get_json()['success'] is False
+
+    def test_get_nonexistent_task_returns_404(self):
+        """Test getting a non-existent task returns 404."""
+        response = self.client.get('/api/v1/tasks/99999')
+        assert response.status_code == 404
+        assert response.get_json()['success'] is False
+
+    def test_delete_task_removes_it(self):
+        """Test a deleted task is no longer found."""
+        task_id = self._create_task('Delete me')
+
+        response = self.client.delete(f'/api/v1/tasks/{task_id}')
+        assert response.status_code == 200
+
+        get_resp = self.client.get(f'/api/v1/tasks/{task_id}')
+        assert get_resp.status_code == 404
+
+    def test_moved_task_found_in_target_list(self):
+        """Test a moved task is still found and deletable by ID."""
+        task_id = self._create_task('Move me')
+        target_resp = self.client.post(
+            '/api/v1/lists',
+            json={'name': 'Target'}
+        )
+        target_id = target_resp.get_json()['data']['id']
+
+        move_resp = self.client.post(
+            f'/api/v1/tasks/{task_id}/move',
+            json={'source_list_id': self.list_id, 'target_list_id': target_id}
+        )
+        assert move_resp.status_code == 200
+
+        assert self.client.get(f'/api/v1/tasks/{task_id}').status_code == 200
+        assert self.client.delete(f'/api/v1/tasks/{task_id}').status_code == 200
+
+    def test_task_gone_after_list_deleted(self):
+        """Test tasks of a deleted list are no longer found."""
+        task_id = self._create_task('Orphan')
+
+        self.client.delete(f'/api/v1/lists/{self.list_id}')
+
+        response = self.client.get(f'/api/v1/tasks/{task_id}')
+        assert response.status_code == 404
+
+
+class TestShutdownPersistence:
+    """Test suite for saving pending changes at interpreter exit."""
+
+    def test_import_without_writes_leaves_storage_untouched(self):
+        """Test importing the app does not overwrite existing storage."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'tasks.json')
+            with open(path, 'w') as f:
+                f.write('{"important": 1}')
+
+            _run_in_dir('import backend.app', tmpdir)
+
+            with open(path) as f:
+                assert json.load(f) == {'important': 1}
+
+    def test_pending_write_saved_at_exit(self):
+        """Test a change made just before exit is saved."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _run_in_dir(
+                'from backend.app import app\n'
+                'app.test_client().post("/api/v1/lists", json={"name": "Kept"})',
+                tmpdir
+            )
+
+            with open(os.path.join(tmpdir, 'tasks.json')) as f:
+                data = json.load(f)
+            assert [tl['name'] for tl in data['lists']] == ['Kept']
+
+    def test_exit_waits_for_in_progress_save(self):
+        """Test exiting mid-save still leaves complete, valid storage."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _run_in_dir(
+                'import threading, time\n'
+                'import backend.app as m\n'
+                'save_dict = m.manager.storage.save_dict\n'
+                'started = threading.Event()\n'
+                'def slow_save_dict(data):\n'
+                '    started.set()\n'
+                '    time.sleep(0.5)\n'
+                '    save_dict(data)\n'
+                'm.manager.storage.save_dict = slow_save_dict\n'
+                'm.app.test_client().post("/api/v1/lists", json={"name": "Slow"})\n'
+                'assert started.wait(5)\n',
+                tmpdir
+            )
+
+            with open(os.path.join(tmpdir, 'tasks.json')) as f:
+                data = json.load(f)
+            assert [tl['name'] for tl in data['lists']] == ['Slow']
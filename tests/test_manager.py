@@ -288,6 +288,29 @@ class TestTaskManagerTaskOperations:
             assert moved_task.status == TaskStatus.IN_PROGRESS
             assert moved_task.tags == ["urgent", "work"]
 
+    def test_iter_all_tasks(self):
+        """Test iterating tasks across all lists in list order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "tasks.json")
+            manager = TaskManager(storage=JSONStorage(file_path))
+
+            work = manager.create_list("Work")
+            personal = manager.create_list("Personal")
+            first = manager.add_task_to_list(work.id, "First")
+            second = manager.add_task_to_list(work.id, "Second")
+            third = manager.add_task_to_list(personal.id, "Third")
+
+            tasks = list(manager.iter_all_tasks())
+            assert tasks == [first, second, third]
+
+    def test_iter_all_tasks_empty(self):
+        """Test iterating tasks with no lists yields nothing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "tasks.json")
+            manager = TaskManager(storage=JSONStorage(file_path))
+
+            assert list(manager.iter_all_tasks()) == []
+
 
 class TestTaskManagerSearch:
     """Test TaskManager search functionality."""
@@ -494,6 +517,22 @@ class TestTaskManagerAutoSave:
             loaded_task = manager2.get_task(task_list.id, task.id)
             assert loaded_task.status == TaskStatus.COMPLETED
 
+    def test_auto_save_disabled(self):
+        """Test that mutations are not saved when auto_save is False."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "tasks.json")
+            storage = JSONStorage(file_path)
+            manager = TaskManager(storage=storage, auto_save=False)
+
+            task_list = manager.create_list("Work")
+            manager.add_task_to_list(task_list.id, "Fix bug")
+            assert not storage.exists()
+
+            manager.save()
+            manager2 = TaskManager(storage=JSONStorage(file_path))
+            manager2.load()
+            assert manager2.get_lists()[0].task_count == 1
+
 
 class TestTaskManagerErrorHandling:
     """Test TaskManager error handling."""
@@ -98,6 +98,37 @@ class TestJSONStorageSaveLoad:
             assert loaded_list.get_task(task1.id).priority == Priority.HIGH
             assert loaded_list.get_task(task2.id).priority == Priority.MEDIUM
 
+    def test_save_dict_and_load(self):
+        """Test saving a pre-serialized container and loading it back."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "tasks.json")
+            storage = JSONStorage(file_path)
+
+            container = ListContainer()
+            task_list = container.create_list("Work")
+            task_list.add_task(Task("Snapshot"))
+            storage.save_dict(container.to_dict())
+
+            loaded = storage.load()
+            assert loaded.list_count == 1
+            assert loaded.get_lists()[0].get_all_tasks()[0].title == "Snapshot"
+
+    def test_failed_save_dict_keeps_previous_file(self):
+        """Test a save that fails midway leaves the old file intact."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "tasks.json")
+            storage = JSONStorage(file_path)
+
+            container = ListContainer()
+            container.create_list("Work")
+            storage.save(container)
+
+            with pytest.raises(IOError):
+                storage.save_dict({"lists": [object()]})
+
+            assert storage.load().list_count == 1
+            assert os.listdir(tmpdir) == ["tasks.json"]
+
     def test_save_preserves_task_status(self):
         """Test that task status is preserved through save/load."""
         with tempfile.TemporaryDirectory() as tmpdir: